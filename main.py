@@ -5,15 +5,41 @@ Connects to Deriv API and streams real-time tick data for R_100 symbol
 """
 
 import asyncio
+import functools
+import inspect
+import itertools
 import json
 import logging
+import operator
 import os
+import queue
 import sys
+import threading
 import websockets
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, List, Any
 import signal
 
+try:
+    import cysimdjson
+except ImportError:
+    cysimdjson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +51,15 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Fields read from every tick, fetched in a single call
+_tick_fields = operator.itemgetter("symbol", "quote", "epoch")
+
+# Number of recent ticks kept for recent_ticks(); must be a power of two
+_TICK_HISTORY_SIZE = 65536
+
+# ":SS" suffixes used to complete a cached "YYYY-MM-DD HH:MM" timestamp prefix
+_SECONDS = tuple(f":{second:02d}" for second in range(60))
+
 class DerivWebSocketClient:
     """
     WebSocket client for Deriv API to stream live tick data
@@ -34,33 +69,106 @@ class DerivWebSocketClient:
         self.api_token = api_token
         self.websocket_url = "wss://ws.deriv.com/websockets/v3"
         self.websocket = None
+        self._recv = None
+        self._send = None
         self.is_connected = False
         self.is_authenticated = False
         self.is_subscribed = False
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
         self.reconnect_delay = 5
+        self.handshake_timeout = 30
+        
+        # Incoming frames are processed in batches of up to max_batch_size,
+        # collected for at most batch_window seconds after the first frame.
+        # This delays display by up to batch_window; set it to 0 to disable batching
+        self.max_batch_size = 64
+        self.batch_window = 0.005
         self.demo_mode = not bool(api_token)
         
         # Request IDs for tracking responses
-        self.request_id = 1
+        self._rid_iter = itertools.count(2)
         
         # Symbol to subscribe to
         self.symbol = "R_100"
         
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Reusable SIMD JSON parser (falls back to json.loads when unavailable)
+        self._parser = cysimdjson.JSONParser() if cysimdjson else None
+        
+        # Outgoing requests only differ by req_id, so they are serialized once;
+        # "%" in the token or symbol is escaped so only req_id is interpolated later
+        self._auth_template = (
+            b'{"authorize":%s,"req_id":%%d}' % self._dumps(api_token).replace(b"%", b"%%")
+            if api_token else None
+        )
+        self._ticks_template = (
+            b'{"ticks":%s,"subscribe":1,"req_id":%%d}' % self._dumps(self.symbol).replace(b"%", b"%%")
+        )
         
-    def _signal_handler(self, signum, frame):
+        # Tick lines are written to the binary stdout buffer by a writer thread;
+        # at most max_pending_output batches are queued, dropping the oldest.
+        # Plain text streams without a buffer (e.g. StringIO, IDLE) get str
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        self._out = stdout_buffer if stdout_buffer is not None else sys.stdout
+        self._out_is_binary = stdout_buffer is not None
+        self.max_pending_output = 1024
+        self.output_stop_timeout = 2
+        self._print_q = queue.Queue(maxsize=self.max_pending_output)
+        self._writer = None
+        self._output_stopping = False
+        
+        # Last formatted (epoch minute, "YYYY-MM-DD HH:MM") pair
+        self._ts_cache = (-1, "")
+        
+        # Ring buffer of recent (epoch, quote) ticks for downstream analysis (requires numpy)
+        self._ticks = (
+            np.zeros(_TICK_HISTORY_SIZE, dtype=[("epoch", "i8"), ("quote", "f8")])
+            if np is not None else None
+        )
+        self._tick_head = 0
+        self._tick_count = 0
+        
+    def _install_signal_handlers(self):
+        """
+        Setup signal handlers for graceful shutdown
+        Handlers run inside the event loop, falling back to signal.signal
+        where the loop does not support them (e.g. Windows)
+        """
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._shutdown_cb, signum)
+            except NotImplementedError:
+                signal.signal(
+                    signum, lambda sig, frame: loop.call_soon_threadsafe(self._shutdown_cb, sig)
+                )
+                
+    def _shutdown_cb(self, signum):
         """Handle shutdown signals gracefully"""
-        logger.info(f"Received signal {signum}, shutting down...")
+        logger.info("Received signal %s, shutting down...", signum)
         asyncio.create_task(self.shutdown())
         
     def get_next_request_id(self) -> int:
         """Generate next request ID"""
-        self.request_id += 1
-        return self.request_id
+        return next(self._rid_iter)
+        
+    def _loads(self, message):
+        """
+        Decode an incoming frame, using the SIMD parser when available.
+        The returned document is only valid until the next call.
+        """
+        if self._parser is None:
+            return json.loads(message)
+        return self._parser.parse(message if isinstance(message, bytes) else message.encode())
+        
+    @staticmethod
+    def _dumps(request: Any) -> bytes:
+        """
+        Serialize an outgoing value to UTF-8 JSON, using orjson when available.
+        """
+        if orjson is None:
+            return json.dumps(request).encode()
+        return orjson.dumps(request)
         
     async def connect(self) -> bool:
         """
@@ -68,15 +176,32 @@ class DerivWebSocketClient:
         Returns True if connection successful, False otherwise
         """
         try:
-            logger.info(f"Connecting to {self.websocket_url}...")
+            logger.info("Connecting to %s...", self.websocket_url)
             
             self.websocket = await websockets.connect(
                 self.websocket_url,
                 ping_interval=30,
                 ping_timeout=10,
-                close_timeout=10
+                close_timeout=10,
+                compression=None  # Skip per-frame permessage-deflate inflation
             )
             
+            # The new asyncio client (websockets >= 14; 13.x still returns the legacy
+            # client here) can return text frames as raw bytes, skipping UTF-8
+            # decoding; the JSON parser validates the payload anyway
+            if "decode" in inspect.signature(self.websocket.recv).parameters:
+                self._recv = functools.partial(self.websocket.recv, decode=False)
+            else:
+                self._recv = self.websocket.recv
+                
+            # Requests are prebuilt UTF-8 bytes; the new asyncio client (websockets >= 14)
+            # can send them as text frames as-is, the legacy client would send bytes as
+            # binary frames
+            if "text" in inspect.signature(self.websocket.send).parameters:
+                self._send = functools.partial(self.websocket.send, text=True)
+            else:
+                self._send = lambda payload: self.websocket.send(payload.decode())
+            
             self.is_connected = True
             self.reconnect_attempts = 0
             logger.info("✅ Connected to Deriv WebSocket API")
@@ -86,11 +211,11 @@ class DerivWebSocketClient:
         except Exception as e:
             error_msg = str(e)
             if "No address associated with hostname" in error_msg:
-                logger.error(f"❌ DNS resolution failed for {self.websocket_url}")
+                logger.error("❌ DNS resolution failed for %s", self.websocket_url)
                 logger.error("💡 This may be a network connectivity issue in the current environment")
                 logger.error("💡 Please check if you have internet access or try again later")
             else:
-                logger.error(f"❌ Connection failed: {e}")
+                logger.error("❌ Connection failed: %s", e)
             self.is_connected = False
             return False
             
@@ -109,39 +234,41 @@ class DerivWebSocketClient:
             return False
             
         try:
-            auth_request = {
-                "authorize": self.api_token,
-                "req_id": self.get_next_request_id()
-            }
+            auth_request = self._auth_template % self.get_next_request_id()
             
             logger.info("🔐 Authenticating with Deriv API...")
-            await self.websocket.send(json.dumps(auth_request))
+            await self._send(auth_request)
             
             # Wait for authentication response
-            response = await self.websocket.recv()
-            auth_response = json.loads(response)
-            
-            if auth_response.get("error"):
-                error_msg = auth_response["error"].get("message", "Unknown error")
-                logger.error(f"❌ Authentication failed: {error_msg}")
-                return False
-                
-            if "authorize" in auth_response:
-                self.is_authenticated = True
-                logger.info("✅ Authentication successful")
-                
-                # Log account info if available
-                if "loginid" in auth_response["authorize"]:
-                    loginid = auth_response["authorize"]["loginid"]
-                    logger.info(f"📊 Logged in as: {loginid}")
-                    
-                return True
-            else:
-                logger.error("❌ Unexpected authentication response")
-                return False
+            response = await self._recv()
+            return self._handle_auth_response(self._loads(response))
                 
         except Exception as e:
-            logger.error(f"❌ Authentication error: {e}")
+            logger.error("❌ Authentication error: %s", e)
+            return False
+            
+    def _handle_auth_response(self, auth_response: Any) -> bool:
+        """
+        Handle the response to an authorize request
+        Returns True if authentication successful, False otherwise
+        """
+        if auth_response.get("error"):
+            error_msg = auth_response["error"].get("message", "Unknown error")
+            logger.error("❌ Authentication failed: %s", error_msg)
+            return False
+            
+        if "authorize" in auth_response:
+            self.is_authenticated = True
+            logger.info("✅ Authentication successful")
+            
+            # Log account info if available
+            if "loginid" in auth_response["authorize"]:
+                loginid = auth_response["authorize"]["loginid"]
+                logger.info("📊 Logged in as: %s", loginid)
+                
+            return True
+        else:
+            logger.error("❌ Unexpected authentication response")
             return False
             
     async def subscribe_to_ticks(self) -> bool:
@@ -150,86 +277,363 @@ class DerivWebSocketClient:
         Returns True if subscription successful, False otherwise
         """
         try:
-            tick_request = {
-                "ticks": self.symbol,
-                "subscribe": 1,
-                "req_id": self.get_next_request_id()
-            }
+            tick_request = self._ticks_template % self.get_next_request_id()
             
-            logger.info(f"📈 Subscribing to {self.symbol} tick data...")
-            await self.websocket.send(json.dumps(tick_request))
+            logger.info("📈 Subscribing to %s tick data...", self.symbol)
+            await self._send(tick_request)
             
             # Wait for subscription confirmation
-            response = await self.websocket.recv()
-            tick_response = json.loads(response)
-            
-            if tick_response.get("error"):
-                error_msg = tick_response["error"].get("message", "Unknown error")
-                logger.error(f"❌ Subscription failed: {error_msg}")
-                return False
+            response = await self._recv()
+            return self._handle_subscribe_response(self._loads(response))
                 
-            if "tick" in tick_response:
-                self.is_subscribed = True
-                logger.info(f"✅ Successfully subscribed to {self.symbol} ticks")
+        except Exception as e:
+            logger.error("❌ Subscription error: %s", e)
+            return False
+            
+    def _handle_subscribe_response(self, tick_response: Any) -> bool:
+        """
+        Handle the response to a ticks subscription request
+        Returns True if subscription successful, False otherwise
+        """
+        if tick_response.get("error"):
+            error_msg = tick_response["error"].get("message", "Unknown error")
+            logger.error("❌ Subscription failed: %s", error_msg)
+            return False
+            
+        if "tick" in tick_response:
+            self.is_subscribed = True
+            logger.info("✅ Successfully subscribed to %s ticks", self.symbol)
+            
+            # Process the first tick
+            self.process_tick(tick_response["tick"])
+            return True
+        else:
+            logger.error("❌ Unexpected subscription response")
+            return False
+            
+    async def _handshake(self) -> bool:
+        """
+        Authenticate and subscribe to ticks in a single round trip
+        Both requests are sent back to back and responses are matched by req_id
+        Returns True if both steps succeeded, False otherwise
+        """
+        if self.demo_mode:
+            return await self.authenticate() and await self.subscribe_to_ticks()
+            
+        try:
+            auth_id = self.get_next_request_id()
+            tick_id = self.get_next_request_id()
+            
+            logger.info("🔐 Authenticating with Deriv API...")
+            await self._send(self._auth_template % auth_id)
+            logger.info("📈 Subscribing to %s tick data...", self.symbol)
+            await self._send(self._ticks_template % tick_id)
+            
+            success = await asyncio.wait_for(
+                self._collect_handshake(auth_id, tick_id),
+                timeout=self.handshake_timeout
+            )
+            
+        except asyncio.TimeoutError:
+            logger.error("❌ Handshake timed out after %s seconds", self.handshake_timeout)
+            success = False
+        except Exception as e:
+            logger.error("❌ Handshake error: %s", e)
+            success = False
+            
+        if not success:
+            # The ticks request went out before the authorize reply, so close the
+            # connection rather than leave a live subscription behind on it
+            self.is_subscribed = False
+            self.is_connected = False
+            try:
+                await self.websocket.close()
+            except Exception as e:
+                logger.error("❌ Error closing WebSocket: %s", e)
                 
-                # Process the first tick
-                await self.process_tick(tick_response["tick"])
+        return success
+            
+    async def _collect_handshake(self, auth_id: int, tick_id: int) -> bool:
+        """
+        Dispatch handshake replies by req_id until both requests are answered
+        Ticks frames are held back until the authorize reply succeeds, so nothing
+        is reported as subscribed on a connection whose token was rejected
+        Returns True if both steps succeeded, False as soon as one fails
+        """
+        held = []
+        authorized = False
+        subscribed = False
+        
+        def handle_ticks_frame(response) -> bool:
+            nonlocal subscribed
+            if subscribed:
+                # Stream ticks that overtook the authorize reply
+                if "tick" in response:
+                    self.process_tick(response["tick"])
                 return True
+            subscribed = self._handle_subscribe_response(response)
+            return subscribed
+            
+        while not (authorized and subscribed):
+            message = await self._recv()
+            response = self._loads(message)
+            req_id = response.get("req_id")
+            
+            if req_id == auth_id:
+                if not self._handle_auth_response(response):
+                    return False
+                authorized = True
+                
+                # Parsed documents don't outlive the next parse, so held frames are re-decoded
+                for message in held:
+                    if not handle_ticks_frame(self._loads(message)):
+                        return False
+                held.clear()
+                
+            elif req_id == tick_id:
+                if not authorized:
+                    held.append(message)
+                elif not handle_ticks_frame(response):
+                    return False
+                    
             else:
-                logger.error("❌ Unexpected subscription response")
-                return False
+                logger.debug("📨 Unmatched message during handshake: %s", message)
                 
-        except Exception as e:
-            logger.error(f"❌ Subscription error: {e}")
-            return False
-            
-    async def process_tick(self, tick_data: Dict[str, Any]):
+        return True
+        
+    def _format_tick(self, tick_data: Any) -> Optional[str]:
         """
-        Process and display tick data
+        Format a single tick as a display line
+        Accepts a simdjson element or, without cysimdjson, a plain dict
+        Returns None if the tick could not be processed
         """
         try:
-            symbol = tick_data.get("symbol", "N/A")
-            quote = tick_data.get("quote", "N/A")
-            epoch = tick_data.get("epoch", 0)
+            # Only these scalars are ever materialized from a simdjson element
+            try:
+                symbol, quote, epoch = _tick_fields(tick_data)
+            except KeyError:
+                # Fall back to defaults when a field is missing
+                symbol = tick_data.get("symbol", "N/A")
+                quote = tick_data.get("quote", "N/A")
+                epoch = tick_data.get("epoch", 0)
             
             # Convert epoch to readable timestamp
             if epoch:
-                timestamp = datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+                # Only call strftime when the minute changes
+                minute, second = divmod(int(epoch), 60)
+                if minute != self._ts_cache[0]:
+                    self._ts_cache = (minute, datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M"))
+                timestamp = self._ts_cache[1] + _SECONDS[second]
             else:
                 timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
             # Format the output
-            print(f"🔴 {timestamp} | {symbol} | Quote: {quote}")
+            return f"🔴 {timestamp} | {symbol} | Quote: {quote}"
             
         except Exception as e:
-            logger.error(f"❌ Error processing tick data: {e}")
+            logger.error("❌ Error processing tick data: %s", e)
+            return None
+            
+    def _record_tick(self, tick_data: Any):
+        """Store a tick's (epoch, quote) in the ring buffer, overwriting the oldest entry when full"""
+        try:
+            # Convert before storing so a bad value never leaves a half-written slot
+            _, quote, epoch = _tick_fields(tick_data)
+            self._ticks[self._tick_head] = (int(epoch), float(quote))
+        except KeyError:
+            # Incomplete ticks are still displayed with defaults but not recorded
+            return
+        except (TypeError, ValueError) as e:
+            logger.debug("Tick not recorded: %s", e)
+            return
+            
+        self._tick_head = (self._tick_head + 1) & (_TICK_HISTORY_SIZE - 1)
+        if self._tick_count < _TICK_HISTORY_SIZE:
+            self._tick_count += 1
+            
+    def recent_ticks(self):
+        """
+        Return buffered ticks, oldest first, as a NumPy structured array
+        with "epoch" and "quote" fields
+        Returns None if numpy is not installed
+        """
+        if self._ticks is None:
+            return None
+        if self._tick_count < _TICK_HISTORY_SIZE:
+            return self._ticks[:self._tick_count].copy()
+        return np.concatenate((self._ticks[self._tick_head:], self._ticks[:self._tick_head]))
+        
+    def process_tick(self, tick_data: Any):
+        """
+        Process and display tick data
+        """
+        line = self._format_tick(tick_data)
+        if line is not None:
+            self.process_ticks([line])
+        if self._ticks is not None:
+            self._record_tick(tick_data)
+            
+    def process_ticks(self, lines: List[str]):
+        """
+        Queue a batch of formatted ticks for the output writer thread
+        """
+        if not lines:
+            return
+            
+        chunk = "\n".join(lines) + "\n"
+        if self._out_is_binary:
+            chunk = chunk.encode()
+            
+        # The writer is started by run(); start it here for direct callers,
+        # but never while _stop_output() is waiting for the previous one
+        if self._writer is None and not self._output_stopping:
+            self._start_output()
+        self._enqueue_output(chunk)
+        
+    def _enqueue_output(self, item):
+        """Queue an item for the writer, dropping the oldest pending output when full"""
+        try:
+            self._print_q.put_nowait(item)
+        except queue.Full:
+            # Drop the oldest pending output rather than block the event loop
+            try:
+                self._print_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._print_q.put_nowait(item)
+            
+    def _start_output(self):
+        """Start the output writer thread"""
+        self._writer = threading.Thread(target=self._output_writer, name="tick-writer", daemon=True)
+        self._writer.start()
+        
+    def _output_writer(self):
+        """
+        Write queued tick lines to stdout, flushing whenever the queue runs dry
+        Runs on a daemon thread so a slow terminal never stalls the event loop
+        Exits when it receives the None sentinel
+        """
+        while True:
+            chunk = self._print_q.get()
+            try:
+                if chunk is None:
+                    self._out.flush()
+                    return
+                self._out.write(chunk)
+                if self._print_q.empty():
+                    self._out.flush()
+            except Exception as e:
+                logger.error("❌ Error writing tick output: %s", e)
+                
+    async def _stop_output(self):
+        """
+        Stop the writer thread once pending output is written
+        Waits at most output_stop_timeout seconds off the event loop, then
+        drops whatever is still queued (e.g. when stdout is stalled)
+        """
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+            
+        self._output_stopping = True
+        try:
+            self._enqueue_output(None)
+            await asyncio.get_running_loop().run_in_executor(
+                None, writer.join, self.output_stop_timeout
+            )
+        finally:
+            self._output_stopping = False
+        
+        if writer.is_alive():
+            logger.warning("⚠️ Output writer stalled, dropping pending tick output")
+            while True:
+                try:
+                    self._print_q.get_nowait()
+                except queue.Empty:
+                    break
+            # Let the writer exit if its blocked write ever completes
+            self._enqueue_output(None)
+            
+    async def _drain_pending(self, batch: List[Any]):
+        """
+        Collect frames that arrive within the batch window, up to max_batch_size
+        The window is a single deadline for the whole batch
+        """
+        if self.batch_window <= 0:
+            return
             
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window
+        
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._recv(), timeout=remaining))
+            except (asyncio.TimeoutError, websockets.exceptions.ConnectionClosed):
+                # A closed connection is reported by the next recv in listen_for_messages
+                break
+                
     async def listen_for_messages(self):
         """
         Listen for incoming WebSocket messages
+        Frames arriving in a burst are handled as one batch
         """
+        if not self.websocket:
+            return
+            
+        # Bind hot-loop lookups to locals once; the connection does not change
+        # while listening (is_connected is still checked since shutdown clears it)
+        recv = self._recv
+        wait_for = asyncio.wait_for
+        drain = self._drain_pending
+        loads = self._loads
+        format_tick = self._format_tick
+        record_tick = self._record_tick if self._ticks is not None else None
+        process_ticks = self.process_ticks
+        
         try:
-            while self.is_connected and self.websocket:
+            while self.is_connected:
                 try:
-                    message = await asyncio.wait_for(
-                        self.websocket.recv(),
+                    message = await wait_for(
+                        recv(),
                         timeout=60  # 60 second timeout
                     )
                     
-                    data = json.loads(message)
+                    batch = [message]
+                    await drain(batch)
                     
-                    # Handle tick data
-                    if "tick" in data:
-                        await self.process_tick(data["tick"])
-                    
-                    # Handle errors
-                    elif "error" in data:
-                        error_msg = data["error"].get("message", "Unknown error")
-                        logger.error(f"❌ API Error: {error_msg}")
+                    # Each parsed document is only valid until the next parse,
+                    # so ticks are formatted as they are decoded
+                    lines = []
+                    for message in batch:
+                        try:
+                            data = loads(message)
+                        except Exception as e:
+                            # Skip the bad frame without losing the rest of the batch
+                            logger.error("❌ Error decoding message: %s", e)
+                            continue
+                            
+                        # Handle tick data
+                        tick = data.get("tick")
+                        if tick is not None:
+                            line = format_tick(tick)
+                            if line is not None:
+                                lines.append(line)
+                            if record_tick is not None:
+                                record_tick(tick)
                         
-                    # Handle other message types
-                    else:
-                        logger.debug(f"📨 Received message: {data}")
+                        # Handle errors
+                        elif "error" in data:
+                            error_msg = data["error"].get("message", "Unknown error")
+                            logger.error("❌ API Error: %s", error_msg)
+                            
+                        # Handle other message types
+                        else:
+                            logger.debug("📨 Received message: %s", message)
+                            
+                    process_ticks(lines)
                         
                 except asyncio.TimeoutError:
                     logger.warning("⏰ No message received within timeout, checking connection...")
@@ -242,25 +646,24 @@ class DerivWebSocketClient:
                     break
                     
         except Exception as e:
-            logger.error(f"❌ Error in message listener: {e}")
+            logger.error("❌ Error in message listener: %s", e)
             
     async def reconnect(self) -> bool:
         """
         Attempt to reconnect to the WebSocket
         """
         if self.reconnect_attempts >= self.max_reconnect_attempts:
-            logger.error(f"❌ Max reconnection attempts ({self.max_reconnect_attempts}) reached")
+            logger.error("❌ Max reconnection attempts (%s) reached", self.max_reconnect_attempts)
             return False
             
         self.reconnect_attempts += 1
-        logger.info(f"🔄 Reconnection attempt {self.reconnect_attempts}/{self.max_reconnect_attempts}")
+        logger.info("🔄 Reconnection attempt %s/%s", self.reconnect_attempts, self.max_reconnect_attempts)
         
         await asyncio.sleep(self.reconnect_delay)
         
         if await self.connect():
-            if await self.authenticate():
-                if await self.subscribe_to_ticks():
-                    return True
+            if await self._handshake():
+                return True
                     
         return False
         
@@ -269,6 +672,8 @@ class DerivWebSocketClient:
         Main run loop with reconnection logic
         """
         logger.info("🚀 Starting Deriv WebSocket Client...")
+        self._install_signal_handlers()
+        self._start_output()
         
         if self.demo_mode:
             logger.warning("⚠️ Running in DEMO MODE - no real API token provided")
@@ -282,14 +687,8 @@ class DerivWebSocketClient:
                         break
                     continue
                     
-                # Authentication
-                if not await self.authenticate():
-                    if not await self.reconnect():
-                        break
-                    continue
-                    
-                # Subscribe to ticks
-                if not await self.subscribe_to_ticks():
+                # Authenticate and subscribe to ticks
+                if not await self._handshake():
                     if not await self.reconnect():
                         break
                     continue
@@ -306,7 +705,7 @@ class DerivWebSocketClient:
                 logger.info("🛑 Received interrupt signal, shutting down...")
                 break
             except Exception as e:
-                logger.error(f"❌ Unexpected error: {e}")
+                logger.error("❌ Unexpected error: %s", e)
                 if not await self.reconnect():
                     break
                     
@@ -318,17 +717,21 @@ class DerivWebSocketClient:
         """
         logger.info("🔄 Shutting down WebSocket client...")
         
+        # Stop the listener before the output writer so no new ticks arrive meanwhile
+        self.is_connected = False
+        
         try:
             if self.websocket and not self.websocket.closed:
                 await self.websocket.close()
                 logger.info("✅ WebSocket connection closed")
         except Exception as e:
-            logger.error(f"❌ Error closing WebSocket: {e}")
+            logger.error("❌ Error closing WebSocket: %s", e)
             
-        self.is_connected = False
         self.is_authenticated = False
         self.is_subscribed = False
         
+        await self._stop_output()
+        
         logger.info("👋 Deriv WebSocket Client shut down complete")
 
 def print_banner():
@@ -370,13 +773,17 @@ async def main():
     except KeyboardInterrupt:
         logger.info("\n🛑 Application interrupted by user")
     except Exception as e:
-        logger.error(f"❌ Fatal error: {e}")
+        logger.error("❌ Fatal error: %s", e)
     finally:
         await client.shutdown()
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # Prefer the libuv-based event loop when available (not supported on Windows)
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n👋 Application terminated by user")
     except Exception as e: